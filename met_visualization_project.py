@@ -7,300 +7,333 @@
 
 from dash import Dash, dcc, html, get_asset_url
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
 import numpy as np
+import json
+import os
+import pycountry
 import re
+import tempfile
 
 pd.options.mode.chained_assignment = None
 background_color = "#f2f3e4"
 app = Dash(__name__)
 
-# let's just use the parts of this we actually need
-
-df = pd.read_csv("MetObjects.csv", 
-    usecols=[
-        "Object Number", 
-        "AccessionYear",
-        "Department",
-        "Culture",
-        "Country",
-        "Is Highlight",
-        ],
-    dtype=str,
-    )
-
-# Drop the Libraries because it is not clear what is included
-# in that category - it does not clearly correspond to any
-#  department
-
-df["Department"] = df['Department'].astype(str)
-df = df.drop(df[(df['Department'] == "The Libraries")].index)
-
-# This adds a cleaned Accession Year column of years (and NaNs) to the dataframe, since
-# the data was mixed
-cleaned_year_list = []
-
-for entry in df["AccessionYear"]:
-    entry = str(entry)
-    pattern = re.compile(r'[0-9]{4}')
-    result = pattern.search(entry)
-    try: 
-      cleaned_year_list.append(result[0])   
-    except:
-        result = None
-        cleaned_year_list.append("")
-
-df["Cleaned Accession Year"] = cleaned_year_list   
-
-# To be able to do comparison operations, we need this to be a numeric column
-df['Cleaned Accession Year'] = pd.to_numeric(df['Cleaned Accession Year'], errors='coerce')
-
-# We need to clean up the location data since there are multiple places that 
-# data could be entered (and it might not exist at all.)
-
-def clean_country_info_column(row):
-    row['Country'] = str(row['Country'])
-    row['Culture'] = str(row['Culture'])
-    if not row['Country'] and not row['Culture']:
-        return np.nan
-    elif not row['Country']:
-        return row['Culture']
-    else:
-        return row['Country']
-
-df["Location"] = df.apply(clean_country_info_column, axis=1)
-
-# We need a dataframe with the total number of objects by department
-dept_info = df['Department'].value_counts().rename_axis('Department Name').reset_index(name='Total Objects')
-dept_info.sort_values(by=["Department Name"])
-
-# Bar chart for total number of objects by department
-fig1 = px.bar(dept_info.sort_values(by=["Department Name"], ascending=False), 
-             x="Total Objects", y="Department Name",
-#             labels={"Total Objects": "Total number of objects in 2023"}
-             )
-
-# Make nicer axes
-
-fig1.update_layout(
-    xaxis_tickformat = ',', 
-    paper_bgcolor=background_color,)
-
-# Let's get the total number of objects owned in 1923 by department. 
-filtered_values = df.loc[df['Cleaned Accession Year'] <= 1923]
-filtered_values_dept = filtered_values['Department'].value_counts().rename_axis('Department Name').reset_index(name='Total Objects in 1923')
-filtered_values_dept.sort_values(by=["Department Name"])
-
-# graph it and make nicer axes
-fig2 = px.bar(filtered_values_dept.sort_values(by=["Department Name"], ascending=False), 
-             x="Total Objects in 1923", y="Department Name",
-             labels={"Total Objects in 1923": "Total Objects"}
-             )
-
-fig2.update_layout(
-    xaxis_tickformat = ',',
-    paper_bgcolor=background_color,)
-
-# Let's find out how many objects were acquired each year by a given department
-# Start by making a data frame that only has the relevant info we care about
-acquisition_df = df[['Department', 'Cleaned Accession Year']]
-
-# count how many objects per year per department 
-acquisition_numbers = acquisition_df.groupby('Department')[["Cleaned Accession Year"]].value_counts()
-
-# turn it into a dataframe
-numbers_df = acquisition_numbers.reset_index()
-
-# Drop the Robert Lehman Collection because all of it was obtained in one year, so not interesting
-numbers_df["Department"] = numbers_df['Department'].astype(str)
-numbers_df = numbers_df.drop(numbers_df[(numbers_df['Department'] == "Robert Lehman Collection")].index)
-
-# give the count column a name (and the other one a better name)
-numbers_df.rename(columns={"Cleaned Accession Year": "Year Acquired",
-                           0 : "Number of Objects"}, inplace=True)
-
-# sort by year  
-numbers_sorted = numbers_df.sort_values(by=["Year Acquired"])
- 
-# We are going to want some custom colors to represent all of these departments
-# since the default dictionary is too short and the colors start repeating
-my_colors=['#f06292','#64ffda','#ef9a9a','#ff5722','#004d40','#ba68c8',
-           '#536dfe','#eeff41','#558b2f','#00acc1', '#66bb6a','#b388ff',
-           '#80d8ff','#9fa8da','#0d47a1','#6a1b9a','#b71c1c','#f9a825','#795548','#616161']
-
-# graph it and make nicer axes
-fig3 = px.line(numbers_sorted, x="Year Acquired", y="Number of Objects", color="Department", 
-               color_discrete_sequence= my_colors, labels = {"Year Acquired": "Acquisition Year",})
-fig3.update_layout(xaxis_tick0 = 1870, xaxis_dtick=5)
-fig3.update_layout(yaxis_tickformat = ',',  paper_bgcolor=background_color,)
-
-
-# Let's find out how many objects were acquired each decade by a given department
-# Start by making a data frame that only has the relevant info we care about
-
-acquisition_df = df[['Department', 'Cleaned Accession Year']]
-acquisition_df = acquisition_df.dropna(subset="Cleaned Accession Year")
-
-# We need to turn years into decades
-acquisition_df['Decade'] = (acquisition_df['Cleaned Accession Year']//10) * 10
-
-# count how many objects per decade per department 
-acquisition_numbers = acquisition_df.groupby('Department')[["Decade"]].value_counts()
-
-# turn it into a dataframe
-numbers_df = acquisition_numbers.reset_index()
-
-# Drop the Robert Lehman Collection because all of it was obtained in one year, so not interesting
-numbers_df["Department"] = numbers_df['Department'].astype(str)
-numbers_df = numbers_df.drop(numbers_df[(numbers_df['Department'] == "Robert Lehman Collection")].index)
-
-# give the count column a name (and the other one a better name)
-numbers_df.rename(columns={"Decade": "Decade Acquired",
-                           0 : "Number of Objects"}, inplace=True)
-
-# sort by year  
-numbers_sorted = numbers_df.sort_values(by=["Decade Acquired"])
-numbers_sorted["Decade Acquired"] = numbers_sorted["Decade Acquired"].astype('category')
-
-pretty_decade_labels = []
-for entry in numbers_sorted["Decade Acquired"]:
-    new_entry = str(entry).replace(".0", "s")
-    pretty_decade_labels.append(new_entry)
-
-numbers_sorted["Pretty Decade"] = pretty_decade_labels
-
-# Since there is no way to control the legend order in Dash, we need to 
-# re-order our color list if we want to ensure the colors of the departments
-# are consistent between these two graphs. 
-my_colors_sorted = ['#f06292','#00acc1','#004d40','#64ffda','#ef9a9a',
-                    '#b388ff','#66bb6a','#ba68c8','#ff5722','#536dfe', 
-                    '#eeff41','#558b2f','#6a1b9a','#0d47a1','#80d8ff',
-                    '#9fa8da','#b71c1c','#f9a825','#795548','#616161']
-
-# graph it and make nicer axes
-
-fig4 = px.bar(numbers_sorted, x="Pretty Decade", y="Number of Objects", color="Department",
-              labels = {"Pretty Decade": "Acquisition by Decade",},
-               color_discrete_sequence= my_colors_sorted)
-fig4.update_layout(yaxis_tickformat = ',',  paper_bgcolor=background_color,)
-
-# Let's make a geographic map of the museum's highlights
-
-df["Is Highlight"] = df["Is Highlight"].astype(str)
-highlight_values = df.loc[df['Is Highlight'] == "True"]
+# Reading and cleaning the CSV is by far the slowest part of starting up, so
+# the cleaned data is cached as Parquet and only rebuilt when the CSV changes.
+# Bump cache_version whenever load() changes the columns it produces, so an
+# old cache is never read back with the wrong schema.
+
+data_file = "MetObjects.csv"
+cache_version = 2
+cache_file = f"met_clean.v{cache_version}.parquet"
+figs_file = "met_figures.json"
+
+def is_up_to_date(path, *sources):
+    return (os.path.exists(path)
+            and all(os.path.getmtime(path) >= os.path.getmtime(source) for source in sources))
+
+# The reloader can restart us in the middle of writing a cache, so each cache is
+# written to a temporary file first and only then moved into place
+def write_atomically(path, write):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def load():
+    if is_up_to_date(cache_file, data_file):
+        return pd.read_parquet(cache_file, engine="pyarrow")
+
+    # let's just use the parts of this we actually need, and keep the strings
+    # in Arrow arrays rather than as millions of separate Python objects
+
+    df = pd.read_csv(data_file, 
+        usecols=[
+            "Object Number", 
+            "AccessionYear",
+            "Department",
+            "Culture",
+            "Country",
+            "Is Highlight",
+            ],
+        dtype="string[pyarrow]",
+        engine="pyarrow",
+        )
+
+    # Drop the Libraries because it is not clear what is included
+    # in that category - it does not clearly correspond to any
+    #  department
+
+    df = df[df['Department'].ne("The Libraries").fillna(True)]
+
+    # There are only a handful of departments, so store them as categories -
+    # every groupby and count below then works on integer codes
+    df["Department"] = df["Department"].astype("category")
+
+    # Is Highlight is just "True" or "False", so make it a real boolean column
+    df["Is Highlight"] = df["Is Highlight"].eq("True").fillna(False).astype(bool)
+
+    # This adds a cleaned Accession Year column of years (and NaNs) to the dataframe, since
+    # the data was mixed.  To be able to do comparison operations, we need this to be
+    # a numeric column
+    df["Cleaned Accession Year"] = pd.to_numeric(
+        df["AccessionYear"].str.extract(r'([0-9]{4})', expand=False), errors='coerce')
+
+    # We need to clean up the location data since there are multiple places that 
+    # data could be entered (and it might not exist at all.)  Prefer the country,
+    # fall back on the culture, and leave it as NaN if neither is present.
+
+    df["Location"] = df["Country"].where(df["Country"].notna(), df["Culture"])
+
+    write_atomically(cache_file, lambda path: df.to_parquet(path, engine="pyarrow"))
+    return df
 
 # Now we need to clean the data up so that we can use the ISO standard to map it
 # The badly formatted data comes in a number of variations so we 
 # have clauses written to handle them
 
+# Every name pycountry knows a country by, so most locations can be checked with
+# a set lookup (plus Turkey, which pycountry now only knows as Türkiye)
+iso_country_names = frozenset(
+    name
+    for country in pycountry.countries
+    for name in (country.name,
+                 getattr(country, "official_name", None),
+                 getattr(country, "common_name", None))
+    if name
+) | frozenset(["Turkey"])
+
 def check_against_iso(country):
+    if country in iso_country_names:
+        return True
+    # Short names like "Russia" or "Korea" are not in the set, so fall back on
+    # pycountry's (much slower) fuzzy search for anything the set does not know
     try:
-       country = pycountry.countries.search_fuzzy(country)
-       return True
-    except:
-       return False
-
+        pycountry.countries.search_fuzzy(country)
+        return True
+    except LookupError:
+        return False
+
+# The patterns and lookup tables only need to be built once, not on every call
+uncertain_pattern = re.compile(r'(?:^|\s)(?:or|and|\(\?\)|probably)(?=\s|$)')
+direction_pattern = re.compile(r'^(?:Northern|Western|Sothern|Southern|South|Central|Lower)\s+(\S+)')
+present_day_pattern = re.compile(r'(?:^|\s)present-day\s+(\S+)')
+formerly_pattern = re.compile(r'^(\S+)\s.*formerly')
+islands = set(['Tahiti', 'Mangareva'])
+outliers = {
+    'Democratic Republic of the Congo': 'Congo (the Democratic Republic of the)',  
+    'Tibet': 'China', 
+    'Iran (Persia)': 'Iran', 
+    'New Spain (Mexico)': 'Mexico'}
 
 def clean_up_location_problems(entry):
     entry = str(entry)
-    discards = set(["or", "and", "(?)", "probably"])
-    directions = set(["Northern", "Western", "Sothern", "Southern", "South", "Central", "Lower"])
-    islands = ['Tahiti', 'Mangareva']
-    outliers = {
-        'Democratic Republic of the Congo': 'Congo (the Democratic Republic of the)',  
-        'Tibet': 'China', 
-        'Iran (Persia)': 'Iran', 
-        'New Spain (Mexico)': 'Mexico'}
     if '|' in entry:
         parts = entry.split('|')
-        if len(list(set(parts))) == 1:
-            entry = parts[0]
-            cleaned_location = entry
+        if len(set(parts)) == 1:
+            cleaned_location = parts[0]
         else:
             cleaned_location = np.nan
-    elif set(entry.split()).intersection(discards):
+    elif uncertain_pattern.search(entry):
         cleaned_location = np.nan
-    elif set(entry.split()).intersection(directions):
-        cleaned_location = entry.split()[1]
+    elif match := direction_pattern.match(entry):
+        cleaned_location = match[1]
     elif entry == "England":
         cleaned_location = "United Kingdom"
-    elif "present-day" in entry.split():
-        cleaned_location = entry.split()[1]
-    elif "formerly" in entry:
-        cleaned_location = entry.split()[0]
+    elif match := present_day_pattern.search(entry):
+        cleaned_location = match[1]
+    elif match := formerly_pattern.match(entry):
+        cleaned_location = match[1]
     elif entry in islands:
         cleaned_location = "French Polynesia"
-    elif entry in outliers.keys():
+    elif entry in outliers:
         cleaned_location = outliers[entry]
     else:
         cleaned_location = np.nan
     
     return(cleaned_location)
 
-unique_locations = highlight_values['Location'].unique()
-problem_locations = []
+# Everything from here on turns the cleaned data into the five figures
 
-for entry in unique_locations:
-    entry = str(entry)
-    if check_against_iso(entry) == False:
-        problem_locations.append(entry)
+def build_figs(df):
+    # We need the total number of objects by department, both now and in 1923.
+    # Counting both in one crosstab only takes a single pass over the data.
+    owned_in_1923 = df['Cleaned Accession Year'].le(1923).fillna(False)
+    # (crosstab leaves out a column if nothing falls in it, so make sure both exist)
+    dept_counts = pd.crosstab(df['Department'], owned_in_1923).reindex(columns=[False, True], fill_value=0)
 
-improved_locations = []
+    # We need a dataframe with the total number of objects by department
+    dept_info = dept_counts.sum(axis=1).rename_axis('Department Name').reset_index(name='Total Objects')
+
+    # Bar chart for total number of objects by department
+    fig1 = px.bar(dept_info.sort_values(by=["Department Name"], ascending=False), 
+                 x="Total Objects", y="Department Name",
+    #             labels={"Total Objects": "Total number of objects in 2023"}
+                 )
+
+    # Make nicer axes
+
+    fig1.update_layout(
+        xaxis_tickformat = ',', 
+        paper_bgcolor=background_color,)
+
+    # Let's get the total number of objects owned in 1923 by department, leaving out
+    # the departments that did not own anything yet.
+    filtered_values_dept = dept_counts.loc[dept_counts[True] > 0, True].rename_axis('Department Name').reset_index(name='Total Objects in 1923')
+
+    # graph it and make nicer axes
+    fig2 = px.bar(filtered_values_dept.sort_values(by=["Department Name"], ascending=False), 
+                 x="Total Objects in 1923", y="Department Name",
+                 labels={"Total Objects in 1923": "Total Objects"}
+                 )
+
+    fig2.update_layout(
+        xaxis_tickformat = ',',
+        paper_bgcolor=background_color,)
+
+    # Let's find out how many objects were acquired each year by a given department
+    # Start by making a data frame that only has the relevant info we care about.
+    # Both the per-year and the per-decade charts are built from this one frame.
+    acquisition_df = df[['Department', 'Cleaned Accession Year']]
+
+    # Drop the Robert Lehman Collection because all of it was obtained in one year, so not interesting
+    acquisition_df = acquisition_df[acquisition_df['Department'].ne("Robert Lehman Collection")]
+
+    # count how many objects per year per department, as a dataframe (giving the
+    # year column a better name as we go)
+    years = acquisition_df['Cleaned Accession Year'].rename('Year Acquired')
+    numbers_df = acquisition_df.groupby(['Department', years], observed=True).size().reset_index(name="Number of Objects")
+
+    # sort by year (and by department within a year, so the order is the same
+    # every time the figures are built)
+    numbers_sorted = numbers_df.sort_values(by=["Year Acquired", "Department"])
+
+    # We are going to want some custom colors to represent all of these departments
+    # since the default dictionary is too short and the colors start repeating
+    my_colors=['#f06292','#64ffda','#ef9a9a','#ff5722','#004d40','#ba68c8',
+               '#536dfe','#eeff41','#558b2f','#00acc1', '#66bb6a','#b388ff',
+               '#80d8ff','#9fa8da','#0d47a1','#6a1b9a','#b71c1c','#f9a825','#795548','#616161']
+
+    # Give each department its own color up front, so that it is the same
+    # department color in both the yearly and the decade graphs
+    department_colors = dict(zip(df['Department'].cat.categories, my_colors))
+
+    # graph it and make nicer axes
+    fig3 = px.line(numbers_sorted, x="Year Acquired", y="Number of Objects", color="Department", 
+                   color_discrete_map= department_colors, labels = {"Year Acquired": "Acquisition Year",})
+    fig3.update_layout(xaxis_tick0 = 1870, xaxis_dtick=5)
+    fig3.update_layout(yaxis_tickformat = ',',  paper_bgcolor=background_color,)
+
+
+    # Let's find out how many objects were acquired each decade by a given department
+    # We can reuse the acquisition data frame from above, turning years into decades
+    # on the fly (groupby leaves out the unknown years for us)
+
+    decades = acquisition_df['Cleaned Accession Year'].floordiv(10).mul(10).rename('Decade Acquired')
+
+    # count how many objects per decade per department, as a dataframe
+    numbers_df = acquisition_df.groupby(['Department', decades], observed=True).size().reset_index(name="Number of Objects")
+
+    # sort by decade (and by department within a decade, as above)
+    numbers_sorted = numbers_df.sort_values(by=["Decade Acquired", "Department"])
+    numbers_sorted["Pretty Decade"] = numbers_sorted["Decade Acquired"].astype("int64").astype(str) + "s"
+    numbers_sorted["Decade Acquired"] = numbers_sorted["Decade Acquired"].astype('category')
+
+    # graph it and make nicer axes, using the same department colors as above
+
+    fig4 = px.bar(numbers_sorted, x="Pretty Decade", y="Number of Objects", color="Department",
+                  labels = {"Pretty Decade": "Acquisition by Decade",},
+                   color_discrete_map= department_colors)
+    fig4.update_layout(yaxis_tickformat = ',',  paper_bgcolor=background_color,)
+
+    # Let's make a geographic map of the museum's highlights
+
+    highlight_values = df[df["Is Highlight"]]
+
+    # Work out the improved version of each distinct location just once - ISO names
+    # are kept as they are and everything else gets cleaned up - then map that
+    # across all the rows (rows with no location at all stay missing)
+    unique_locations = highlight_values['Location'].dropna().unique()
+    improved_locations = {
+        entry: entry if check_against_iso(entry) else clean_up_location_problems(entry)
+        for entry in unique_locations}
+
+    highlight_values["Improved Location"] = highlight_values['Location'].map(improved_locations)
+
+    # Get rid of the rows where we could not successfully clean the country data
+    highlight_values= highlight_values.dropna(subset="Improved Location")
+
+    # Now we can get the number of objects per country
+    highlight_numbers = highlight_values["Improved Location"].value_counts().rename_axis("Country of Origin").reset_index(name="Highlights")
+
+    # Graph it and make it pretty
+    fig5 = px.scatter_geo(highlight_numbers, locations="Country of Origin", 
+                          hover_data={"Highlights": True, "Country of Origin": False}, hover_name="Country of Origin",
+                          locationmode = "country names", 
+                          )
+
+    fig5.update_layout(
+        paper_bgcolor=background_color,
+        plot_bgcolor=background_color,
+        geo = dict(
+            projection_type="orthographic",
+            showcoastlines=True,
+            landcolor="#f3ee97",
+            showland=True,
+            showocean = True,
+            showlakes = False,
+            oceancolor = "#97cff3",
+            showcountries = True,
+            fitbounds="locations",
+            bgcolor=background_color,
+        ),
+        height=426, 
+        width=426,
+        title=dict(
+            text="Map of Global Highlights",
+            y = 0.05,
+            x = 0.5,
+            font=dict(
+                family="Serif",
+                size=16,
+                color="black"
+            ), 
+        )
 
-for entry in highlight_values['Location']:
-    entry = str(entry)
-    if entry in problem_locations:
-        cleaned_location = clean_up_location_problems(entry)
-        improved_locations.append(cleaned_location)
-    else:
-        improved_locations.append(entry)
-
-
-highlight_values["Improved Location"] = improved_locations
-
-# Get rid of the rows where we could not successfully clean the country data
-highlight_values= highlight_values.dropna(subset="Improved Location")
-
-# Now we can get the number of objects per country
-highlight_numbers = highlight_values["Improved Location"].value_counts().rename_axis("Country of Origin").reset_index(name="Highlights")
-
-# Graph it and make it pretty
-fig5 = px.scatter_geo(highlight_numbers, locations="Country of Origin", 
-                      hover_data={"Highlights": True, "Country of Origin": False}, hover_name="Country of Origin",
-                      locationmode = "country names", 
-                      )
-
-fig5.update_layout(
-    paper_bgcolor=background_color,
-    plot_bgcolor=background_color,
-    geo = dict(
-        projection_type="orthographic",
-        showcoastlines=True,
-        landcolor="#f3ee97",
-        showland=True,
-        showocean = True,
-        showlakes = False,
-        oceancolor = "#97cff3",
-        showcountries = True,
-        fitbounds="locations",
-        bgcolor=background_color,
-    ),
-    height=426, 
-    width=426,
-    title=dict(
-        text="Map of Global Highlights",
-        y = 0.05,
-        x = 0.5,
-        font=dict(
-            family="Serif",
-            size=16,
-            color="black"
-        ), 
     )
 
-)
+    fig5.update_traces(marker=dict(color="Red", size=5))
+
+    return {"fig1": fig1, "fig2": fig2, "fig3": fig3, "fig4": fig4, "fig5": fig5}
+
+# Building the figures means going through all of the data again, so the
+# finished figures are cached as JSON too.  They are rebuilt whenever the cleaned
+# data is, or when this file changes - in which case load() can still hand back
+# the cached data rather than parsing the CSV again.
+
+def load_figs():
+    if (os.path.exists(cache_file)
+            and is_up_to_date(figs_file, data_file, cache_file, __file__)):
+        with open(figs_file) as f:
+            return {name: go.Figure(fig) for name, fig in json.load(f).items()}
+
+    figs = build_figs(load())
+
+    def write_figs(path):
+        with open(path, "w") as f:
+            f.write(pio.json.to_json_plotly({name: fig.to_plotly_json() for name, fig in figs.items()}))
+
+    write_atomically(figs_file, write_figs)
+    return figs
 
-fig5.update_traces(marker=dict(color="Red", size=5))
+figs = load_figs()
 
 # Turn all of this work into something displayed
 
@@ -370,12 +403,12 @@ app.layout = html.Div([
 
         html.Div([   
             html.H3('1923', style={'textAlign': 'center'}),
-            dcc.Graph(id='objects-vs-depts-1923', figure = fig2),], 
+            dcc.Graph(id='objects-vs-depts-1923', figure = figs['fig2']),], 
             style={'width': '49%', 'display': 'inline-block', 'padding': '0 50', },),
 
         html.Div([
             html.H3('2023', style={'textAlign': 'center'}),
-            dcc.Graph(id='objects-vs-depts-2023', figure = fig1)], 
+            dcc.Graph(id='objects-vs-depts-2023', figure = figs['fig1'])], 
             style={'width': '49%', 'display': 'inline-block', 'padding': '0 20', 'float': 'right'}),
         
         html.P(),
@@ -389,7 +422,7 @@ app.layout = html.Div([
 
         dcc.Graph(
             id='objects-by-dept-by-year',
-            figure = fig3),
+            figure = figs['fig3']),
         
         html.P(),
         html.Div([dcc.Markdown(acquisitions_over_time_text)]),
@@ -402,7 +435,7 @@ app.layout = html.Div([
     
     html.Div([dcc.Markdown(acquisitions_by_decade_text)]),
         dcc.Graph(id='objects-by-dept-by-decade',
-        figure = fig4
+        figure = figs['fig4']
     )], style={'margin':'2em'}),
 
 # Mapped Highlights
@@ -425,7 +458,7 @@ app.layout = html.Div([
                 ),
 
             html.Div([   
-                dcc.Graph(id='geo-map-highlights', figure = fig5)],
+                dcc.Graph(id='geo-map-highlights', figure = figs['fig5'])],
                style={"border":"5px black solid", "height": "425", "width": "425", "margin": "0 0 5"}
                        ),
         ],style={'margin':'2em', 'display': 'flex'}),